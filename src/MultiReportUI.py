@@ -22,19 +22,56 @@ warnings.filterwarnings("ignore", message=".*clean_up_tokenization_spaces.*", ca
 import tkinter as tk
 from tkinter import ttk, Listbox, Scrollbar, messagebox, filedialog
 import os
+from concurrent.futures import as_completed
+from concurrent.futures.process import BrokenProcessPool
 
 from embedder import SBERTEmbedder
-from matcher import match_requirements_to_report
+from matcher import match_requirements_to_report, match_requirements_to_reports
 from translations import translate
 from extractor import extract_requirements_from_standard_pdf, detect_standard_from_pdf
-from parser import extract_paragraphs_from_pdf
+from parser import extract_paragraphs_from_pdf, count_uncached_pages
+from process_pool import make_process_pool, worth_parallelizing
 from menu_manager import configure_export_menu
 from language_manager import switch_language_and_update_ui
 from event_handlers import handle_requirement_selection
-from file_handler import select_standard_file, select_reports_multi
+from file_handler import select_standard_file, select_reports_multi, encode_report_paras
+
+
+def _iter_parsed_reports(paths):
+    """Parse report PDFs in worker processes, one per report, and yield (path, paragraphs or exception)
+    as each one finishes. Only the paragraph lists are sent back from the workers.
+    Reports are parsed serially when there are too few uncached pages for the pool start-up to pay off,
+    and the remaining reports are parsed serially if the process pool is unavailable."""
+    done = set()
+    if len(paths) > 1 and worth_parallelizing(sum(count_uncached_pages(path) for path in paths)):
+        try:
+            with make_process_pool(min(os.cpu_count() or 1, len(paths))) as executor:
+                futures = {executor.submit(extract_paragraphs_from_pdf, path): path for path in paths}
+                for future in as_completed(futures):
+                    path = futures[future]
+                    try:
+                        result = future.result()
+                    except BrokenProcessPool:
+                        raise
+                    except Exception as e:
+                        result = e
+                    done.add(path)
+                    yield path, result
+        except (OSError, BrokenProcessPool) as e:
+            print(f"Parallel report parsing failed, falling back to serial parsing: {e}")
+    for path in paths:
+        if path in done:
+            continue
+        try:
+            yield path, extract_paragraphs_from_pdf(path)
+        except Exception as e:
+            yield path, e
 
 
 class MultiReportApp(tk.Tk):
+    # Buttons disabled while a selected PDF is processed in the background (see file_handler)
+    job_button_attrs = ("select_standard_btn", "add_reports_btn", "parse_reports_btn", "run_match_btn", "export_llm_btn")
+
     def __init__(self):
         super().__init__()
         self.title(translate("multi_report_app_title") if translate("multi_report_app_title") != "multi_report_app_title" else translate("app_title") + " (Multi)")
@@ -259,13 +296,13 @@ class MultiReportApp(tk.Tk):
     def _select_standard_file(self):
         # Preserve current reports while switching standard; clear only matches
         old_std = self.standard_pdf_path
+        select_standard_file(self, on_finished=lambda: self._restore_reports_after_standard_change(old_std))
+
+    def _restore_reports_after_standard_change(self, old_std):
+        # If a new standard was selected, restore the reports as they are now and reset UI states accordingly
         preserved = {p: {'paras': d.get('paras'), 'emb': d.get('emb'), 'matches': None}
                      for p, d in (self.reports or {}).items()}
         prev_current = self.current_report_path
-
-        select_standard_file(self)
-
-        # If a new standard was selected, restore preserved reports and reset UI states accordingly
         if self.standard_pdf_path and self.standard_pdf_path != old_std and preserved:
             self.reports = preserved
 
@@ -308,19 +345,21 @@ class MultiReportApp(tk.Tk):
         if not self.reports:
             return
         total = len(self.reports)
-        parsed_count = 0
-        for i, (path, data) in enumerate(self.reports.items(), start=1):
-            if data['paras']:
-                parsed_count += 1
-                continue
+        pending = [path for path, data in self.reports.items() if not data['paras']]
+        parsed_count = total - len(pending)
+        # Reports are parsed in parallel; each one is embedded here as soon as its paragraphs arrive
+        for i, (path, result) in enumerate(_iter_parsed_reports(pending), start=parsed_count + 1):
+            data = self.reports[path]
             prog_txt = translate('parsing_report', current=i, total=total, name=os.path.basename(path))
             if prog_txt == 'parsing_report':
                 prog_txt = f"Parsing report {i}/{total}: {os.path.basename(path)}"
             self._update_progress_status(prog_txt, int((i - 1) / total * 100))
             try:
-                data['paras'] = extract_paragraphs_from_pdf(path)
+                if isinstance(result, Exception):
+                    raise result
+                data['paras'] = result
                 if data['paras']:
-                    data['emb'] = self.embedder.encode(data['paras'])
+                    data['emb'] = encode_report_paras(self, path, data['paras'])
                     parsed_count += 1
                 else:
                     print(f"No paragraphs extracted from {path}")
@@ -338,6 +377,11 @@ class MultiReportApp(tk.Tk):
             messagebox.showwarning(translate("warning") if translate("warning") != "warning" else "Warning",
                                    translate('no_paras_to_export'))
 
+    def _take_report_emb(self, path):
+        """Return a report's paragraph embeddings and drop the app's reference to them."""
+        emb, self.reports[path]['emb'] = self.reports[path]['emb'], None
+        return emb
+
     def _run_all_matching(self):
         if not self._validate_state_for_operation("matching"):
             return
@@ -359,32 +403,55 @@ class MultiReportApp(tk.Tk):
                                    translate("no_parsed_reports") if translate("no_parsed_reports") != "no_parsed_reports" else "No parsed reports available for matching.")
             return
         processed = 0
+        ready_paths = []
         for path, data in self.reports.items():
             if not data['paras']:
                 continue
-            # Re-encode paragraphs on the fly if embeddings were freed previously
+            processed += 1
+            base_status = translate('processing_report', current=processed, total=total_reports, name=os.path.basename(path))
+            if base_status == 'processing_report':
+                base_status = f"Processing report {processed}/{total_reports}: {os.path.basename(path)}"
+            self._update_progress_status(base_status, int(processed / total_reports * 100))
+            # Re-encode paragraphs on the fly if embeddings were freed previously (usually a disk cache hit)
             if data.get('emb') is None:
                 try:
-                    data['emb'] = self.embedder.encode(data['paras'])
+                    data['emb'] = encode_report_paras(self, path, data['paras'])
                 except Exception as e:
                     print(f"Error encoding paragraphs for {path}: {e}")
                     continue
+            ready_paths.append(path)
 
-            processed += 1
-            base_status = translate('processing_report', current=processed, total=total_reports, name=os.path.basename(path))
-            if base_status == 'processing_report':
-                base_status = f"Processing report {processed}/{total_reports}: {os.path.basename(path)}"
-            self._update_progress_status(base_status, int(processed / total_reports * 100))
-            try:
-                all_matches = match_requirements_to_report(self.standard_emb, data['emb'])
-                text_matches = {text: all_matches[idx] for idx, text in enumerate(standard_texts) if idx < len(all_matches)}
-                data['matches'] = text_matches
-                # Free memory after matching
-                data['emb'] = None
-            except Exception as e:
-                print(f"Error matching {path}: {e}")
-                messagebox.showwarning(translate("warning") if translate("warning") != "warning" else "Warning",
-                                       f"Matching failed for: {os.path.basename(path)}")
+        # Match all reports at once: one similarity computation over the paragraphs of every report.
+        # The app's references to the embeddings are handed over, so they are freed once all are stacked.
+        self._update_progress_status(translate("performing_matching"))
+        try:
+            per_report = match_requirements_to_reports(
+                self.standard_emb, (self._take_report_emb(path) for path in ready_paths), normalize=False
+            )
+        except Exception as e:
+            print(f"Error matching reports together, matching them one by one: {e}")
+            per_report = None
+        failed = []
+        for i, path in enumerate(ready_paths):
+            data = self.reports[path]
+            if per_report is not None:
+                all_matches = per_report[i]
+            else:
+                # Isolate failures per report; embeddings handed to the batched call are re-encoded (usually a disk cache hit)
+                try:
+                    emb = data['emb'] if data.get('emb') is not None else encode_report_paras(self, path, data['paras'])
+                    all_matches = match_requirements_to_report(self.standard_emb, emb, normalize=False)
+                except Exception as e:
+                    print(f"Error matching {path}: {e}")
+                    failed.append(path)
+                    continue
+                finally:
+                    data['emb'] = None  # Free memory after matching
+            text_matches = {text: all_matches[idx] for idx, text in enumerate(standard_texts) if idx < len(all_matches)}
+            data['matches'] = text_matches
+        if failed:
+            messagebox.showwarning(translate("warning") if translate("warning") != "warning" else "Warning",
+                                   f"Matching failed for: {', '.join(os.path.basename(p) for p in failed)}")
         if self.current_report_path and self.reports[self.current_report_path].get('matches'):
             self._project_current_report(self.current_report_path)
         self.status_label.config(text=translate("matching_completed_label"))
@@ -49,6 +49,9 @@ class ComplianceApp(tk.Tk):
     - Export the results in various formats (CSV, Excel, PDF).
     """
 
+    # Buttons disabled while a selected PDF is processed in the background (see file_handler)
+    job_button_attrs = ("select_standard_btn", "select_report_btn", "run_match_btn", "export_llm_btn")
+
     def __init__(self):
         """
         Initializes the ComplianceApp GUI, sets up the main layout, and initializes state variables.
@@ -227,7 +230,7 @@ class ComplianceApp(tk.Tk):
         self.update_idletasks()
 
         # This returns a flat list of matches for all texts that were embedded (sub-points or full texts)
-        all_matches = match_requirements_to_report(self.standard_emb, self.report_emb, top_k=10)
+        all_matches = match_requirements_to_report(self.standard_emb, self.report_emb, top_k=10, normalize=False)
 
         # Re-structure the flat list of matches into a dictionary mapping text -> matches
         self.matches = {}
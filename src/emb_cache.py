@@ -0,0 +1,89 @@
+"""
+This script provides a small on-disk cache for text embeddings.
+Encoding a standard or a report with Sentence-BERT is by far the most expensive step when a file
+is selected, so embeddings are stored per PDF and reused when the same file is loaded again.
+
+Key Features:
+- Keys cover the PDF content (blake2b hash), the embedding model and a version tag, so a changed file,
+  model or extraction/parsing logic results in a cache miss.
+- Embeddings are stored as compressed NumPy archives under `~/.cache/sustainability-nlp/embeddings/`.
+- Cache failures are reported but never fatal; the caller simply re-encodes.
+
+Usage:
+- Build a key with `cache_key(pdf_path, model_name, version)`.
+- Use `load(key)` to fetch cached embeddings (None on a miss) and `save(key, embeddings)` to store them.
+"""
+
+import hashlib
+import os
+
+import numpy as np
+
+_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "sustainability-nlp", "embeddings")
+# Bump when the embedder's output changes (e.g., normalization), so stale entries are not reused
+_CACHE_VERSION = 2
+_CHUNK_SIZE = 1 << 20  # Hash files in 1 MiB chunks instead of reading them into memory at once
+
+
+def cache_key(pdf_path, model_name, version):
+    """
+    Builds the cache key for the embeddings of a PDF.
+
+    Args:
+        pdf_path (str): Path to the PDF file the embedded texts were extracted from.
+        model_name (str): Name of the embedding model.
+        version (str or int): Version of the extraction/parsing logic that produced the texts.
+
+    Returns:
+        str: A hex digest identifying the cache entry.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    with open(pdf_path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            h.update(chunk)
+    raw_key = f"{h.hexdigest()}::{model_name}::{version}::{_CACHE_VERSION}"
+    return hashlib.blake2b(raw_key.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _cache_path(key):
+    return os.path.join(_CACHE_DIR, f"{key}.npz")
+
+
+def load(key):
+    """
+    Loads cached embeddings.
+
+    Args:
+        key (str): A key created with `cache_key`.
+
+    Returns:
+        numpy.ndarray or None: The cached embeddings, or None if the entry is missing or unreadable.
+    """
+    try:
+        with np.load(_cache_path(key)) as data:
+            return data["emb"]
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Ignoring unreadable embedding cache entry {key}: {e}")
+        return None
+
+
+def save(key, embeddings):
+    """
+    Stores embeddings in the cache.
+
+    Args:
+        key (str): A key created with `cache_key`.
+        embeddings (torch.Tensor or numpy.ndarray): The embeddings to store.
+    """
+    if hasattr(embeddings, "cpu"):  # torch.Tensor (possibly on GPU)
+        embeddings = embeddings.cpu().numpy()
+    path = _cache_path(key)
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp.npz"
+        np.savez_compressed(tmp_path, emb=np.asarray(embeddings))
+        os.replace(tmp_path, path)  # Atomic, so readers never see a partial file
+    except OSError as e:
+        print(f"Could not write embedding cache entry {key}: {e}")
@@ -6,14 +6,18 @@ used for various natural language processing tasks such as similarity computatio
 Key Features:
 - Uses a pre-trained multilingual SBERT model by default.
 - Encodes text segments into high-dimensional embeddings suitable for downstream tasks.
+- Runs in half precision on CUDA GPUs with tensor cores and returns L2-normalized embeddings in large batches.
 
 Usage:
 - Instantiate the `SBERTEmbedder` class with an optional model name.
 - Use the `encode` method to convert a list of text segments into embeddings.
 """
 
+import torch
 from sentence_transformers import SentenceTransformer
 
+ENCODE_BATCH_SIZE = 128
+
 
 class SBERTEmbedder:
     """
@@ -31,7 +35,12 @@ class SBERTEmbedder:
             model_name (str): The name of the pre-trained SBERT model to use.
                              Defaults to 'sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2'.
         """
+        self.model_name = model_name
         self.model = SentenceTransformer(model_name)
+        if torch.cuda.is_available() and torch.cuda.get_device_capability() >= (7, 0):
+            # FP16 roughly doubles encoding throughput on tensor cores (Volta and newer GPUs);
+            # older GPUs have no tensor cores and keep FP32
+            self.model = self.model.half().to("cuda")
 
     def encode(self, segments):
         """
@@ -41,7 +50,26 @@ class SBERTEmbedder:
             segments (list of str): A list of text segments to be encoded.
 
         Returns:
-            torch.Tensor: A tensor containing the embeddings for the input segments.
+            torch.Tensor: A tensor containing the L2-normalized embeddings for the input segments.
                           Each row corresponds to the embedding of a segment.
         """
-        return self.model.encode(segments, convert_to_tensor=True)
+        return self.model.encode(
+            segments,
+            batch_size=ENCODE_BATCH_SIZE,
+            convert_to_tensor=True,
+            normalize_embeddings=True,
+            show_progress_bar=False,
+        )
+
+    def as_tensor(self, embeddings):
+        """
+        Converts embeddings (e.g., loaded from the embedding cache) to a tensor on the model's device,
+        so they can be matched together with freshly encoded embeddings without a host round-trip.
+
+        Args:
+            embeddings (numpy.ndarray or torch.Tensor): The embeddings to convert.
+
+        Returns:
+            torch.Tensor: The embeddings on the same device as the output of `encode`.
+        """
+        return torch.as_tensor(embeddings, device=self.model.device)
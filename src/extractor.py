@@ -14,8 +14,19 @@ Usage:
 - The output is a dictionary mapping requirement codes to their corresponding text segments.
 """
 
+import functools
+import hashlib
+import io
+import os
+from concurrent.futures.process import BrokenProcessPool
+import pickle
 import re
 import pdfplumber
+from process_pool import make_process_pool, worth_parallelizing
+
+# Bump whenever the extraction logic changes so that cached results are invalidated.
+EXTRACTOR_VERSION = 7
+_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "sustainability-nlp")
 
 # --- Standard detection helpers ---
 def detect_standard(text, threshold: float = 0.55) -> str:
@@ -54,13 +65,23 @@ def detect_standard(text, threshold: float = 0.55) -> str:
     return "ESRS" if esrs_score >= gri_score else "GRI"
 
 
+def _file_signature(pdf_path):
+    """
+    Returns (absolute path, modification time, size) of a file, used as an in-process cache key
+    so that a modified file is processed again.
+    """
+    st = os.stat(pdf_path)
+    return os.path.abspath(pdf_path), st.st_mtime_ns, st.st_size
+
+
 def detect_standard_from_pdf(pdf_path: str) -> str:
     """
     Reads the PDF and returns 'ESRS', 'GRI', or 'UNKNOWN'.
+    The standard is detected while extracting the requirements and cached with them
+    (see `_extract_requirements_from_standard_pdf`), so the PDF is not parsed a second time.
     """
     try:
-        full_text = extract_text_from_pdf(pdf_path)
-        return detect_standard(full_text)
+        return _extract_requirements_from_standard_pdf(*_file_signature(pdf_path))[1]
     except Exception:
         return "UNKNOWN"
 
@@ -68,6 +89,17 @@ def detect_standard_from_pdf(pdf_path: str) -> str:
 # ------------------------------------------------------------------
 # Helper function to filter footers from page text
 # ------------------------------------------------------------------
+# Patterns for typical footer content
+_FOOTER_PATTERNS = (
+    re.compile(r'^\s*page\s*\d+\s*(?:of\s*\d+)?\s*$', re.IGNORECASE),  # "Page 1", "Page 1 of 10"
+    re.compile(r'^\s*\d+\s*$'),  # Standalone page numbers
+    re.compile(r'^\s*\[\s*draft\s*\]\s*$', re.IGNORECASE),  # "[Draft]"
+    re.compile(r'\b(?:january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{4}', re.IGNORECASE), # "November 2022"
+    # Add other recurring footers if needed, e.g., company name or report title
+    # re.compile(r'My Company Name SE', re.IGNORECASE),
+)
+
+
 def _filter_footers(page_text):
     """
     Removes common footer patterns from the text of a single page.
@@ -80,20 +112,10 @@ def _filter_footers(page_text):
     """
     lines = page_text.split('\n')
     
-    # Patterns for typical footer content
-    footer_patterns = [
-        re.compile(r'^\s*page\s*\d+\s*(?:of\s*\d+)?\s*$', re.IGNORECASE),  # "Page 1", "Page 1 of 10"
-        re.compile(r'^\s*\d+\s*$'),  # Standalone page numbers
-        re.compile(r'^\s*\[\s*draft\s*\]\s*$', re.IGNORECASE),  # "[Draft]"
-        re.compile(r'\b(?:january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{4}', re.IGNORECASE), # "November 2022"
-        # Add other recurring footers if needed, e.g., company name or report title
-        # re.compile(r'My Company Name SE', re.IGNORECASE),
-    ]
-    
     cleaned_lines = []
     for line in lines:
         is_footer = False
-        for pattern in footer_patterns:
+        for pattern in _FOOTER_PATTERNS:
             if pattern.search(line):
                 is_footer = True
                 break
@@ -106,6 +128,65 @@ def _filter_footers(page_text):
 # ------------------------------------------------------------------
 # Extract and clean text from a PDF
 # ------------------------------------------------------------------
+# Only whitespace runs that actually change are matched; single spaces are left alone
+_INLINE_WS_RE = re.compile(r"[ \t]{2,}|\t")
+
+# Each worker task opens the PDF once and extracts a contiguous block of this many pages.
+_PAGES_PER_TASK = 8
+
+
+def _extract_page_range(pdf_path, start, stop):
+    """
+    Extracts the footer-filtered text of the pages in [start, stop).
+    Runs in a worker process, hence it opens the PDF itself.
+
+    Args:
+        pdf_path (str): Path to the PDF file.
+        start (int): Index of the first page to extract.
+        stop (int): Index after the last page to extract.
+
+    Returns:
+        list of str: The text of each page in the range, in page order.
+    """
+    with pdfplumber.open(pdf_path) as pdf:
+        return [_filter_footers(pdf.pages[i].extract_text() or "") for i in range(start, stop)]
+
+
+def _iter_pages_text(pdf_path):
+    """
+    Yields the footer-filtered text of each page of a PDF, in page order.
+    Page extraction is CPU-bound and independent per page, so large PDFs are split into
+    blocks of pages that are processed in parallel worker processes.
+
+    Args:
+        pdf_path (str): Path to the PDF file.
+
+    Yields:
+        str: The text of each page.
+    """
+    with pdfplumber.open(pdf_path) as pdf:
+        page_count = len(pdf.pages)
+        # Smaller PDFs are extracted serially, as the process pool start-up would dominate
+        if not worth_parallelizing(page_count):
+            for page in pdf.pages:
+                yield _filter_footers(page.extract_text() or "")
+            return
+
+    starts = range(0, page_count, _PAGES_PER_TASK)
+    stops = [min(start + _PAGES_PER_TASK, page_count) for start in starts]
+    done = 0  # Pages already yielded, so a fallback can resume after them
+    try:
+        with make_process_pool(min(os.cpu_count() or 1, len(starts))) as executor:
+            # map() yields results in submission order, which preserves the page order
+            for block in executor.map(_extract_page_range, [pdf_path] * len(starts), starts, stops):
+                for page_text in block:
+                    done += 1
+                    yield page_text
+    except (OSError, BrokenProcessPool) as e:
+        print(f"Parallel PDF extraction failed, falling back to serial extraction: {e}")
+        yield from _extract_page_range(pdf_path, done, page_count)
+
+
 def extract_text_from_pdf(pdf_path):
     """
     Opens a PDF file and extracts the full text from all pages as a single string.
@@ -118,16 +199,22 @@ def extract_text_from_pdf(pdf_path):
     Returns:
         str: Cleaned text extracted from the PDF.
     """
-    with pdfplumber.open(pdf_path) as pdf:
-        # Extract text from each page, filter footers, or return an empty string
-        pages_text = [_filter_footers(page.extract_text() or "") for page in pdf.pages]
-    
-    raw_text = "\n".join(pages_text)  # Combine text from all pages
-    text = re.sub(r"-\n", "", raw_text)  # Remove hyphenated line breaks
+    # Stream the footer-filtered pages (extracted in parallel for large PDFs) into one buffer,
+    # so no list of page strings is kept alongside the combined text
+    buf = io.StringIO()
+    for i, page_text in enumerate(_iter_pages_text(pdf_path)):
+        if i:
+            buf.write("\n")  # Pages are separated by a single newline
+        buf.write(page_text)
+
+    # Each step rebinds `text`, so at most two copies of the text are alive at any time
+    text = buf.getvalue()
+    buf.close()
+    text = text.replace("-\n", "")  # Remove hyphenated line breaks
     text = text.replace("\r", "")  # Remove carriage returns
     # Preserve newlines for structure - only clean excessive whitespace within lines
-    text = re.sub(r"[ \t]+", " ", text)  # Replace multiple spaces/tabs with single space
-    text = re.sub(r"\n[ \t]+", "\n", text)  # Remove leading whitespace after newlines
+    text = _INLINE_WS_RE.sub(" ", text)  # Replace multiple spaces/tabs with single space
+    text = text.replace("\n ", "\n")  # Remove leading whitespace after newlines (already collapsed to one space)
     text = text.strip()  # Remove leading/trailing whitespace
     return text
 
@@ -135,12 +222,70 @@ def extract_text_from_pdf(pdf_path):
 # ------------------------------------------------------------------
 # Identify requirements based on patterns
 # ------------------------------------------------------------------
-def find_requirements(text):
+# A table of contents line ends with a dot leader and a page number, e.g. "Strategy ........ 12".
+# Whitespace is restricted to the current line so that the check stays line-local.
+_TOC_LINE_RE = re.compile(r'\.{2,}[^\S\n]*\d+[^\S\n]*$', re.MULTILINE)
+
+# Patterns to match different types of requirements, grouped by standard.
+# The `^` anchor ensures we only match at the beginning of a line.
+# Each alternative is wrapped in a named group, so `m.lastgroup` tells which one matched.
+# DNK criteria. DNK standards cite GRI indicators often enough to be detected as GRI,
+# so these patterns are part of both specialized scanners.
+_DNK_CRITERIA_PATTERNS = (
+    r"^(?P<kriterium>Kriterium\s+\d{1,2})",
+    r"^(?P<criterion>Criterion\s+\d{1,2})",
+)
+# ESRS patterns (including DNK criteria)
+_ESRS_REQ_PATTERNS = (
+    r"^(?P<esrs_dr>Disclosure\s+Requirement\s+(?P<esrs_dr_code>[GES]\d{1,2}[\-–—−]\d{1,2})\s*[\-–—−][^\n]*)",
+    r"^(?P<esrs_disclosure>Disclosure\s+(?P<esrs_disclosure_code>[GES]\d{1,2}[\-–—−]\d{1,2})\s*[\-–—−][^\n]*)",
+    r"^(?P<esrs>(?P<esrs_code>[GES]\d{1,2}[\-–—−]\d{1,2})\s*[\-–—−][^\n]*)",
+) + _DNK_CRITERIA_PATTERNS + (
+    r"^(?P<dnk>\b\d{1,2}\.\s+(?:Strategie|Wesentlichkeit|Ziele|Tiefe der Wertschöpfungskette|Verantwortung|Regeln und Prozesse|Kontrolle|Anreizsysteme|Beteiligung von Anspruchsgruppen|Innovations- und Produktmanagement|Inanspruchnahme natürlicher Ressourcen|Ressourcenmanagement|Klimarelevante Emissionen|Arbeitnehmerrechte|Chancengleichheit|Qualifizierung|Menschenrechte|Gemeinwesen|Politische Einflussnahme|Gesetzes- und richtlinienkonformes Verhalten))",
+)
+# GRI Patterns
+_GRI_REQ_PATTERNS = (
+    r"^(?P<gri>GRI(?:\s+SRS)?[\- ]?(?P<gri_code>\d{1,3}[\-–—−]\d{1,2})[^\n]*)",
+    r"^(?P<gri_disclosure>Disclosure\s+(?P<gri_disclosure_code>\d{1,3}[\-–—−]\d{1,2})[^\n]*)",
+    r"^(?P<gri_angabe>Angabe\s+(?P<gri_angabe_code>\d{1,3}[\-–—−]\d{1,2})[^\n]*)",
+    # NEW: GRI "Requirement N: ..." headers (appear before disclosures)
+    r"^(?P<gri_requirement>Requirement\s+(?P<gri_requirement_code>\d+)\s*:\s*[^\n]*)",
+)
+# All alternatives are anchored at line starts and free of nested quantifiers, so the stdlib engine
+# scans in linear time. google-re2 was measured ~7x slower on this pattern (str offsets have to be
+# mapped back from UTF-8) and treats \s, \d and \b as ASCII-only, which would change the matches.
+_REQ_REGEX = re.compile("|".join(_ESRS_REQ_PATTERNS + _GRI_REQ_PATTERNS), re.MULTILINE)
+# Specialized scanners for a detected standard (see `detect_standard`); other values use `_REQ_REGEX`
+_REQ_REGEX_BY_STANDARD = {
+    "ESRS": re.compile("|".join(_ESRS_REQ_PATTERNS), re.MULTILINE),
+    "GRI": re.compile("|".join(_GRI_REQ_PATTERNS + _DNK_CRITERIA_PATTERNS), re.MULTILINE),
+}
+
+# Classification per pattern: group name -> (standard type, group holding the code, code prefix).
+# DNK criteria headings are matched but not classified, so they are skipped.
+_REQ_KINDS = {
+    "esrs_dr": ("esrs", "esrs_dr_code", ""),
+    "esrs_disclosure": ("esrs", "esrs_disclosure_code", ""),
+    "esrs": ("esrs", "esrs_code", ""),
+    "kriterium": ("esrs", "kriterium", ""),
+    "criterion": ("esrs", "criterion", ""),
+    "gri": ("gri", "gri_code", ""),
+    "gri_disclosure": ("gri", "gri_disclosure_code", ""),
+    "gri_angabe": ("gri", "gri_angabe_code", ""),
+    "gri_requirement": ("gri", "gri_requirement_code", "Requirement "),
+}
+
+
+def find_requirements(text, standard=None):
     """
     Identifies requirements in the text using predefined patterns.
 
     Args:
         text (str): The input text to search for requirements.
+        standard (str, optional): The detected standard ('ESRS' or 'GRI'). If given, only the
+                                  patterns of that standard (and the DNK criteria) are scanned;
+                                  otherwise all patterns are. If that scan finds nothing, e.g.
+                                  for a misdetected document, all patterns are scanned instead.
 
     Returns:
         list of tuple: A list of tuples where each tuple contains:
@@ -149,28 +294,15 @@ def find_requirements(text):
                        - The standard type ('esrs' or 'gri')
                        - The full designation/title (str)
     """
-    # Define patterns to match different types of requirements.
-    # The `^` anchor ensures we only match at the beginning of a line.
-    patterns = [
-        # ESRS Patterns
-        r"^(Disclosure\s+Requirement\s+([GES]\d{1,2}[\-–—−]\d{1,2})\s*[\-–—−][^\n]*)",
-        r"^(Disclosure\s+([GES]\d{1,2}[\-–—−]\d{1,2})\s*[\-–—−][^\n]*)",
-        r"^(([GES]\d{1,2}[\-–—−]\d{1,2})\s*[\-–—−][^\n]*)",
-        r"^(Kriterium\s+\d{1,2})",
-        r"^(Criterion\s+\d{1,2})",
-        r"^(\b\d{1,2}\.\s+(?:Strategie|Wesentlichkeit|Ziele|Tiefe der Wertschöpfungskette|Verantwortung|Regeln und Prozesse|Kontrolle|Anreizsysteme|Beteiligung von Anspruchsgruppen|Innovations- und Produktmanagement|Inanspruchnahme natürlicher Ressourcen|Ressourcenmanagement|Klimarelevante Emissionen|Arbeitnehmerrechte|Chancengleichheit|Qualifizierung|Menschenrechte|Gemeinwesen|Politische Einflussnahme|Gesetzes- und richtlinienkonformes Verhalten))",
-        # GRI Patterns
-        r"^((GRI(?:\s+SRS)?[\- ]?\d{1,3}[\-–—−]\d{1,2})[^\n]*)",
-        r"^(Disclosure\s+(\d{1,3}[\-–—−]\d{1,2})[^\n]*)",
-        r"^((Angabe\s+(\d{1,3}[\-–—−]\d{1,2}))[^\n]*)",
-        # NEW: GRI "Requirement N: ..." headers (appear before disclosures)
-        r"^(Requirement\s+\d+\s*:\s*[^\n]*)",
-    ]
-    combined_pattern = "|".join(patterns)
-    regex = re.compile(combined_pattern, re.MULTILINE)
 
+    regex = _REQ_REGEX_BY_STANDARD.get(standard, _REQ_REGEX)
     matches = []
     for m in regex.finditer(text):
+        # The pattern that matched determines the standard type and where the code is
+        kind = _REQ_KINDS.get(m.lastgroup)
+        if kind is None:
+            continue  # Unknown/irrelevant match
+
         # Check for table of contents pattern. This can be single or multi-line.
         # A TOC entry is a line ending with '....' and a page number.
         # For multi-line entries, the '....' might be on a subsequent line.
@@ -184,65 +316,68 @@ def find_requirements(text):
         context = text[line_start:context_end]
 
         # Now check if any line in this context ends with the TOC pattern.
-        if any(re.search(r'\.{2,}\s*\d+\s*$', line) for line in context.split('\n')):
+        # A single multiline scan over the window avoids splitting it into lines.
+        if _TOC_LINE_RE.search(context):
             continue # Skip this match as it's part of a TOC entry.
 
-        # Determine the standard type, code, and full designation in a language-agnostic way
-        full_designation = m.group(0).strip()
-        code = ""
-        standard_type = None
-
-        # NEW: Detect GRI "Requirement N: <title>" header
-        if re.search(r"^Requirement\s+\d+\s*:", full_designation, flags=re.IGNORECASE):
-            standard_type = 'gri'
-            m_req = re.search(r"Requirement\s+(\d+)\s*:", full_designation, flags=re.IGNORECASE)
-            if m_req:
-                code = f"Requirement {m_req.group(1)}"
-        # GRI detection (English or German: Disclosure/Angabe)
-        elif re.search(r"\bGRI\b", full_designation, flags=re.IGNORECASE) or \
-           re.search(r"\b(?:Disclosure|Angabe)\s+\d{1,3}[\-–—−]\d{1,2}\b", full_designation, flags=re.IGNORECASE):
-            standard_type = 'gri'
-            m_code = re.search(r"(\d{1,3}[\-–—−]\d{1,2})", full_designation)
-            code = m_code.group(1) if m_code else ""
-        # ESRS detection (code or keywords)
-        elif re.search(r"\b[GES]\d{1,2}[\-–—−]\d{1,2}\b", full_designation) or \
-             re.search(r"\bDisclosure\s+Requirement\b", full_designation, flags=re.IGNORECASE) or \
-             re.search(r"\b(Kriterium|Criterion)\b", full_designation, flags=re.IGNORECASE):
-            standard_type = 'esrs'
-            m_code = re.search(r"([GES]\d{1,2}[\-–—−]\d{1,2})", full_designation, flags=re.IGNORECASE)
-            if m_code:
-                code = m_code.group(1)
-            else:
-                m_krit = re.search(r"(Kriterium\s+\d{1,2}|Criterion\s+\d{1,2})", full_designation, flags=re.IGNORECASE)
-                code = m_krit.group(1) if m_krit else ""
-        else:
-            continue  # Unknown/irrelevant match
+        standard_type, code_group, prefix = kind
+        code = prefix + m.group(code_group).strip()
+        matches.append((code, m.start(), standard_type, m.group(0).strip()))
 
-        if code:
-            matches.append((code.strip(), m.start(), standard_type, full_designation))
+    if not matches and regex is not _REQ_REGEX:
+        # Nothing of the detected standard was found; the detection may be wrong, so scan for everything
+        return find_requirements(text)
 
-    # Sort matches by their position in the text
-    matches.sort(key=lambda x: x[1])
+    # finditer yields matches in start-offset order, so no re-sort is needed
     return matches
 
 
 # ------------------------------------------------------------------
 # Extract sections based on identified requirements
 # ------------------------------------------------------------------
-def extract_requirements(text):
+# Section headers that leak into requirement texts and sub-points
+_UNWANTED_HEADERS = ("Metrics and targets", "Impact, risk and opportunity management")
+_UNWANTED_HEADERS_RE = re.compile("|".join(map(re.escape, _UNWANTED_HEADERS)), re.IGNORECASE)
+# Requirement texts are cut at the application requirements section
+_APP_REQ_RE = re.compile(re.escape("APPLICATION REQUIREMENTS"), re.IGNORECASE)
+# Start of the actual content, which is often a numbered or lettered list ("1.", "15.", "(a)", "a.")
+_CONTENT_START_RE = re.compile(r'(?:\d{1,2}\.|\([a-z]\)|[a-z]\.)\s+')
+
+
+def _strip_unwanted_sections(text):
+    """
+    Removes leaked section headers and cuts the text at "APPLICATION REQUIREMENTS".
+    Each step is a single scan with a precompiled pattern.
+
+    Args:
+        text (str): The text to clean.
+
+    Returns:
+        str: The cleaned text.
+    """
+    cleaned = _UNWANTED_HEADERS_RE.sub('', text)
+    m = _APP_REQ_RE.search(cleaned)
+    if m:
+        cleaned = cleaned[:m.start()]
+    return cleaned
+
+
+def extract_requirements(text, standard=None):
     """
     Extracts sections of text corresponding to identified requirements.
 
     Args:
         text (str): The input text containing requirements and their descriptions.
+        standard (str, optional): The detected standard ('ESRS' or 'GRI'), passed to `find_requirements`.
 
     Returns:
         dict: A dictionary where keys are requirement codes and values are dictionaries
               containing the full text ('full_text'), a list of sub-points ('sub_points'),
               and the full designation ('full_designation').
     """
-    req_matches = find_requirements(text)
+    req_matches = find_requirements(text, standard)
     requirements = {}
+    full_text_parts = {}  # code -> list of text parts, joined after the loop
 
     def _clean_full_designation(designation):
         """
@@ -271,27 +406,12 @@ def extract_requirements(text):
         """
         # Remove trailing dots and page numbers first
         cleaned = re.sub(r'\.{2,}\s*\d*\s*$', '', text)
-        
-        # Remove specific unwanted headers
-        unwanted_headers = [
-            "Metrics and targets",
-            "Impact, risk and opportunity management"
-        ]
-        for header in unwanted_headers:
-            # Using re.IGNORECASE to match case-insensitively
-            cleaned = re.sub(re.escape(header), '', cleaned, flags=re.IGNORECASE)
-
-        # Trim text at "APPLICATION REQUIREMENTS"
-        app_req_marker = "APPLICATION REQUIREMENTS"
-        marker_idx = cleaned.upper().find(app_req_marker)
-        if marker_idx != -1:
-            cleaned = cleaned[:marker_idx]
-
-        # Pattern to find the start of the actual content, which is often a numbered or lettered list.
-        # This looks for patterns like "1.", "15.", "(a)", "a.", etc.
-        content_start_pattern = re.compile(r'(?:\d{1,2}\.|\([a-z]\)|[a-z]\.)\s+')
-        
-        match = content_start_pattern.search(cleaned)
+
+        # Remove specific unwanted headers and trim text at "APPLICATION REQUIREMENTS"
+        cleaned = _strip_unwanted_sections(cleaned)
+
+        # Find the start of the actual content, which is often a numbered or lettered list
+        match = _CONTENT_START_RE.search(cleaned)
         
         if match:
             cleaned = cleaned[match.start():]
@@ -330,30 +450,20 @@ def extract_requirements(text):
         if full_text:
             if code not in requirements:
                 requirements[code] = {'full_text': "", 'sub_points': [], 'full_designation': _clean_full_designation(full_designation)}
-            
-            requirements[code]['full_text'] += " " + full_text
+                full_text_parts[code] = []
+
+            # Collect the parts and join them once below, instead of re-copying the text on every append
+            full_text_parts[code].append(full_text)
             requirements[code]['sub_points'].extend(sub_points)
 
     # Clean up the final dictionary
     for code in requirements:
-        requirements[code]['full_text'] = _clean_full_text(requirements[code]['full_text'].strip(), code)
+        requirements[code]['full_text'] = _clean_full_text(" ".join(full_text_parts[code]).strip(), code)
 
         # Clean unwanted headers from sub-points as well
-        unwanted_headers = [
-            "Metrics and targets",
-            "Impact, risk and opportunity management"
-        ]
-        app_req_marker = "APPLICATION REQUIREMENTS"
         cleaned_sub_points = []
         for sp in requirements[code]['sub_points']:
-            cleaned_sp = sp
-            for header in unwanted_headers:
-                cleaned_sp = re.sub(re.escape(header), '', cleaned_sp, flags=re.IGNORECASE)
-            
-            # Trim text at "APPLICATION REQUIREMENTS" for sub-points
-            marker_idx = cleaned_sp.upper().find(app_req_marker)
-            if marker_idx != -1:
-                cleaned_sp = cleaned_sp[:marker_idx]
+            cleaned_sp = _strip_unwanted_sections(sp)
 
             # Add the cleaned sub-point only if it's not empty
             if cleaned_sp.strip():
@@ -374,28 +484,25 @@ def _process_esrs_segment(segment: str):
     return _process_segment_core(segment, 'esrs')
 
 
+# Boundary markers that end the requirement part of a GRI segment:
+# - English: "Compilation requirements" (optional)
+# - German: "Erläuterungen" (explanations)
+# - German: "Hintergrundinformationen" (background information)
+_GRI_BOUNDARY_RE = re.compile(
+    r'Compilation\s+requirements|\bErläuterungen\b|\bHintergrundinformationen\b',
+    re.IGNORECASE,
+)
+
+
 def _process_gri_segment(segment: str):
     """
     GRI-specific segment processing wrapper.
     Internally calls the core processor with 'gri'.
     """
-    # Trim from the earliest occurrence of any boundary marker:
-    # - English: "Compilation requirements" (optional)
-    # - German: "Erläuterungen" (explanations)
-    # - German: "Hintergrundinformationen" (background information)
-    markers = [
-        r'Compilation\s+requirements',
-        r'\bErläuterungen\b',
-        r'\bHintergrundinformationen\b',
-    ]
-    earliest = None
-    for pat in markers:
-        m = re.search(pat, segment, flags=re.IGNORECASE)
-        if m:
-            if earliest is None or m.start() < earliest:
-                earliest = m.start()
-    if earliest is not None:
-        segment = segment[:earliest].rstrip()
+    # Trim from the earliest occurrence of any boundary marker (one scan finds the leftmost one)
+    m = _GRI_BOUNDARY_RE.search(segment)
+    if m:
+        segment = segment[:m.start()].rstrip()
     return _process_segment_core(segment, 'gri')
 
 
@@ -433,11 +540,9 @@ def _process_segment_core(segment, standard_type):
                - list: A list of individual sub-points.
     """
     # Discard everything according to "APPLICATION REQUIREMENTS" before any further processing
-    _app_marker = "APPLICATION REQUIREMENTS"
-    upper_seg = segment.upper()
-    marker_idx = upper_seg.find(_app_marker)
-    if marker_idx != -1:
-        segment = segment[:marker_idx]
+    m_app = _APP_REQ_RE.search(segment)
+    if m_app:
+        segment = segment[:m_app.start()]
 
     lines = segment.split('\n')
     # Containers for final combination
@@ -759,12 +864,70 @@ def _process_segment_core(segment, standard_type):
     return " ".join(result_parts_gri).strip(), sub_points_gri
 
 
+# ------------------------------------------------------------------
+# On-disk cache for extracted requirements
+# ------------------------------------------------------------------
+def _requirements_cache_path(pdf_path):
+    """
+    Builds the cache file path for a standard PDF.
+    The key covers the file path, modification time and size, so any change to the file
+    (or to EXTRACTOR_VERSION) results in a cache miss.
+
+    Args:
+        pdf_path (str): Path to the standard PDF file.
+
+    Returns:
+        str: Path of the pickle file holding the cached requirements and detected standard.
+    """
+    st = os.stat(pdf_path)
+    raw_key = f"{os.path.abspath(pdf_path)}:{st.st_mtime_ns}:{st.st_size}:{EXTRACTOR_VERSION}"
+    key = hashlib.blake2b(raw_key.encode("utf-8")).hexdigest()
+    return os.path.join(_CACHE_DIR, f"{key}.pkl")
+
+
+def _load_cached_requirements(cache_path):
+    """
+    Loads cached (requirements, detected standard), returning None if the entry is missing or unreadable.
+    """
+    try:
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Ignoring unreadable cache entry {cache_path}: {e}")
+        return None
+
+
+def _store_cached_requirements(cache_path, result):
+    """
+    Stores extracted (requirements, detected standard) in the cache. Failures are reported but never fatal.
+    """
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)  # Atomic, so readers never see a partial file
+    except OSError as e:
+        print(f"Could not write cache entry {cache_path}: {e}")
+
+
 # ------------------------------------------------------------------
 # Main function: Process a standard PDF and return consolidated requirements
 # ------------------------------------------------------------------
+# Markers of trailing sections (e.g., glossary, appendix) that are cut from the last requirement
+_END_MARKERS = ("Appendix", "Glossar", "Definitions", "Contact", "Imprint")
+_END_MARKERS_RE = re.compile("|".join(map(re.escape, _END_MARKERS)), re.IGNORECASE)
+
+
 def extract_requirements_from_standard_pdf(pdf_path):
     """
     Processes a standard PDF to extract and consolidate requirements.
+    Results are cached on disk (see `_requirements_cache_path`), so reprocessing an
+    unchanged standard skips PDF parsing entirely. They are also memoized in-process per
+    file path, modification time and size, so the returned dictionary is shared between
+    calls and must not be mutated (use `copy.deepcopy` first if needed).
 
     Args:
         pdf_path (str): Path to the standard PDF file.
@@ -773,8 +936,28 @@ def extract_requirements_from_standard_pdf(pdf_path):
         dict: A dictionary where keys are requirement codes and values are dictionaries
               containing the full text and a list of sub-points.
     """
+    return _extract_requirements_from_standard_pdf(*_file_signature(pdf_path))[0]
+
+
+@functools.lru_cache(maxsize=8)
+def _extract_requirements_from_standard_pdf(pdf_path, mtime_ns, size):
+    """
+    Memoized implementation of `extract_requirements_from_standard_pdf`. `mtime_ns` and `size`
+    are only part of the cache key.
+
+    Returns:
+        tuple: The requirements dictionary and the detected standard ('ESRS', 'GRI' or 'UNKNOWN'),
+               which are cached together.
+    """
+    cache_path = _requirements_cache_path(pdf_path)
+    cached = _load_cached_requirements(cache_path)
+    if cached is not None:
+        return cached
+
     full_text = extract_text_from_pdf(pdf_path)  # Extract and clean text from the PDF
-    req_dict = extract_requirements(full_text)  # Extract requirements from the text
+    standard = detect_standard(full_text)
+    # Only scan for the patterns of the detected standard (all patterns if it is unknown)
+    req_dict = extract_requirements(full_text, standard)  # Extract requirements from the text
 
     # Post-process the last requirement to remove unwanted sections (e.g., glossary, appendix)
     if req_dict:
@@ -791,13 +974,14 @@ def extract_requirements_from_standard_pdf(pdf_path):
             Returns:
                 str: The cleaned text.
             """
-            end_markers = ["Appendix", "Glossar", "Definitions", "Contact", "Imprint"]
-            for marker in end_markers:
-                idx = text.lower().find(marker.lower())
-                if idx != -1:
-                    return text[:idx]  # Trim the text at the marker
+            # One scan finds the earliest marker instead of one lower-cased copy per marker
+            m = _END_MARKERS_RE.search(text)
+            if m:
+                return text[:m.start()]  # Trim the text at the marker
             return text
 
         req_dict[last_key]['full_text'] = trim_end_noise(paragraph)  # Clean the last requirement
 
-    return req_dict
\ No newline at end of file
+    result = (req_dict, standard)
+    _store_cached_requirements(cache_path, result)
+    return result
\ No newline at end of file
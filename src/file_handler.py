@@ -6,92 +6,241 @@ and updating the application state.
 import tkinter as tk
 from tkinter import filedialog, messagebox
 import os
+import queue
+import threading
 from translations import translate
-from extractor import extract_requirements_from_standard_pdf
-from parser import extract_paragraphs_from_pdf
+from extractor import extract_requirements_from_standard_pdf, EXTRACTOR_VERSION
+from parser import extract_paragraphs_from_pdf, PARSER_VERSION
 from extractor import detect_standard_from_pdf
+import emb_cache
 
-def select_standard_file(app):
+_POLL_INTERVAL_MS = 50  # How often the Tk main thread checks whether background work has finished
+
+def _encode_cached(app, pdf_path, texts, version):
     """
-    Opens a dialog to select a standard PDF, extracts requirements, and updates the app's UI and state.
+    Encodes texts extracted from a PDF, reusing embeddings cached for the same file.
     Args:
         app: The main ComplianceApp instance.
+        pdf_path (str): Path to the PDF the texts were extracted from.
+        texts (list of str): The texts to encode.
+        version: Version of the extraction logic that produced the texts.
+    Returns:
+        The embeddings for the texts.
     """
-    path = filedialog.askopenfilename(title=translate("select_standard"), filetypes=[("PDF Files", "*.pdf")])
-    if not path:
-        return
+    key = emb_cache.cache_key(pdf_path, app.embedder.model_name, version)
+    cached = emb_cache.load(key)
+    if cached is not None and len(cached) == len(texts):
+        # Keep the same type/device as freshly encoded embeddings, so matching stays on the tensor path
+        return app.embedder.as_tensor(cached)
+    embeddings = app.embedder.encode(texts)
+    emb_cache.save(key, embeddings)
+    return embeddings
 
-    app.standard_pdf_path = path
-    app.status_label.config(text=f"Standard: {os.path.basename(path)}. {translate('extracting_requirements')}")
-    app.update_idletasks()
+def encode_report_paras(app, pdf_path, paras):
+    """
+    Encodes the paragraphs extracted from a report PDF, reusing cached embeddings of the same file.
+    Args:
+        app: The application instance (ComplianceApp or MultiReportApp).
+        pdf_path (str): Path to the report PDF.
+        paras (list of str): The paragraphs returned by `extract_paragraphs_from_pdf`.
+    Returns:
+        The embeddings for the paragraphs.
+    """
+    return _encode_cached(app, pdf_path, paras, f"parser-{PARSER_VERSION}")
 
-    try:
-        app.requirements_data = extract_requirements_from_standard_pdf(app.standard_pdf_path)
-        
-        app.detected_standard = detect_standard_from_pdf(app.standard_pdf_path)
+def _run_bg(app, work_fn, on_done, on_error):
+    """
+    Runs `work_fn` in a background thread so the Tk event loop stays responsive.
+    The thread never touches widgets; it posts UI updates (e.g. intermediate statuses) to a queue
+    that the main thread drains while polling via `app.after`. Once the thread has finished,
+    the main thread calls `on_done(result)` or `on_error(exception)`.
+    Args:
+        app: The Tk application instance.
+        work_fn (callable): The function to run in the background. It is called with one argument,
+                            a function that takes a callable and runs it on the main thread.
+        on_done (callable): Called on the main thread with the result of `work_fn`.
+        on_error (callable): Called on the main thread with the exception raised by `work_fn`.
+    """
+    outcome = {}
+    ui_updates = queue.Queue()
+
+    def worker():
+        try:
+            outcome['result'] = work_fn(ui_updates.put)
+        except Exception as e:
+            outcome['error'] = e
 
-        app.req_listbox.delete(0, tk.END)
-        if app.requirements_data:
-            for code in app.requirements_data.keys():
-                app.req_listbox.insert(tk.END, code)
+    thread = threading.Thread(target=worker, daemon=True)
+    thread.start()
+
+    def poll():
+        finished = not thread.is_alive()  # Checked first, so updates posted before the end are drained below
+        while True:
+            try:
+                update = ui_updates.get_nowait()
+            except queue.Empty:
+                break
+            update()
+        if not finished:
+            app.after(_POLL_INTERVAL_MS, poll)
+        elif 'error' in outcome:
+            on_error(outcome['error'])
         else:
-            app.req_listbox.insert(tk.END, translate("no_reqs_found"))
-
-        app.status_label.config(text=f"{len(app.requirements_data)} {translate('reqs_loaded')}")
-        app.update_idletasks()
-        
-        # Prepare texts for embedding: use sub-points if available, otherwise full text
-        standard_texts_for_embedding = []
-        for req_code, req_data in app.requirements_data.items():
-            if req_data['sub_points']:
-                standard_texts_for_embedding.extend(req_data['sub_points'])
-            else:
-                standard_texts_for_embedding.append(req_data['full_text'])
-        
-        app.standard_emb = app.embedder.encode(standard_texts_for_embedding)
-        
-        app.status_label.config(
-            text=f"{translate('standard_ready')} {translate('standard_detected', standard=app.detected_standard or 'UNKNOWN')}"
-        )
-        app.select_report_btn.config(state=tk.NORMAL)
-        app.export_menu.entryconfig(0, state=tk.NORMAL)
-    except Exception as e:
-        messagebox.showerror(translate("error_processing_standard"), f"An error occurred:\n{e}")
-        app.status_label.config(text=translate("error_try_again"))
+            on_done(outcome['result'])
 
-def select_report_file(app):
+    app.after(_POLL_INTERVAL_MS, poll)
+
+def _process_standard(app, path, post_ui):
     """
-    Opens a dialog to select a report PDF, extracts paragraphs, and updates the app's UI and state.
+    Background step for a standard PDF: extracts requirements, detects the standard and embeds the texts.
+    """
+    requirements_data = extract_requirements_from_standard_pdf(path)
+    detected_standard = detect_standard_from_pdf(path)
+    post_ui(lambda: app.status_label.config(text=f"{len(requirements_data)} {translate('reqs_loaded')}"))
+
+    # Prepare texts for embedding: use sub-points if available, otherwise full text
+    standard_texts_for_embedding = []
+    for req_code, req_data in requirements_data.items():
+        if req_data['sub_points']:
+            standard_texts_for_embedding.extend(req_data['sub_points'])
+        else:
+            standard_texts_for_embedding.append(req_data['full_text'])
+
+    standard_emb = _encode_cached(app, path, standard_texts_for_embedding, f"extractor-{EXTRACTOR_VERSION}")
+    return requirements_data, detected_standard, standard_emb
+
+def _apply_standard(app, result):
+    """
+    Main-thread step for a standard PDF: stores the results and updates the UI.
+    """
+    app.requirements_data, app.detected_standard, app.standard_emb = result
+
+    app.req_listbox.delete(0, tk.END)
+    if app.requirements_data:
+        for code in app.requirements_data.keys():
+            app.req_listbox.insert(tk.END, code)
+    else:
+        app.req_listbox.insert(tk.END, translate("no_reqs_found"))
+
+    app.status_label.config(
+        text=f"{translate('standard_ready')} {translate('standard_detected', standard=app.detected_standard or 'UNKNOWN')}"
+    )
+    app.select_report_btn.config(state=tk.NORMAL)
+    app.export_menu.entryconfig(0, state=tk.NORMAL)
+
+def _show_report_paras(app, report_paras):
+    """
+    Main-thread step for a report PDF once its paragraphs are extracted, before they are embedded.
+    """
+    app.report_paras = report_paras
+    app.status_label.config(text=f"{len(report_paras)} {translate('paras_found')}")
+    # Update active report label with paragraph count
+    if hasattr(app, '_update_current_report_label'):
+        app._update_current_report_label()
+
+def _process_report(app, path, post_ui):
+    """
+    Background step for a report PDF: extracts and embeds the paragraphs.
+    """
+    report_paras = extract_paragraphs_from_pdf(path)
+    post_ui(lambda: _show_report_paras(app, report_paras))
+    report_emb = encode_report_paras(app, path, report_paras)
+    return report_paras, report_emb
+
+def _apply_report(app, result):
+    """
+    Main-thread step for a report PDF: stores the results and updates the UI.
+    """
+    app.report_paras, app.report_emb = result
+
+    app.status_label.config(text=translate("report_ready"))
+    app.run_match_btn.config(state=tk.NORMAL)
+    app.export_menu.entryconfig(1, state=tk.NORMAL)
+    # Update active report label with paragraph count (state ready)
+    if hasattr(app, '_update_current_report_label'):
+        app._update_current_report_label()
+
+# What differs between selecting a standard and a report; everything else is shared
+_PDF_JOBS = {
+    "standard": {
+        "title_key": "select_standard",
+        "path_attr": "standard_pdf_path",
+        "status": lambda path: f"Standard: {os.path.basename(path)}. {translate('extracting_requirements')}",
+        "process": _process_standard,
+        "apply": _apply_standard,
+        "error_key": "error_processing_standard",
+    },
+    "report": {
+        "title_key": "select_report",
+        "path_attr": "report_pdf_path",
+        "status": lambda path: f"Report: {os.path.basename(path)}. Parsing paragraphs...",
+        "process": _process_report,
+        "apply": _apply_report,
+        "error_key": "error_processing_report",
+    },
+}
+
+def _pick_pdf_and_process(app, kind, on_finished=None):
+    """
+    Opens a dialog to select a PDF and processes it in a background thread.
+    The buttons listed in the app's `job_button_attrs` are disabled while the job runs.
     Args:
         app: The main ComplianceApp instance.
+        kind (str): The kind of PDF, a key of `_PDF_JOBS` ('standard' or 'report').
+        on_finished (callable, optional): Called on the main thread after processing has finished,
+                                          whether it succeeded or not.
     """
-    path = filedialog.askopenfilename(title=translate("select_report"), filetypes=[("PDF Files", "*.pdf")])
+    job = _PDF_JOBS[kind]
+    path = filedialog.askopenfilename(title=translate(job["title_key"]), filetypes=[("PDF Files", "*.pdf")])
     if not path:
         return
 
-    app.report_pdf_path = path
-    app.status_label.config(text=f"Report: {os.path.basename(path)}. Parsing paragraphs...")
-    app.update_idletasks()
-
-    try:
-        app.report_paras = extract_paragraphs_from_pdf(app.report_pdf_path)
-        app.status_label.config(text=f"{len(app.report_paras)} {translate('paras_found')}")
-        app.update_idletasks()
-        # Update active report label with paragraph count
-        if hasattr(app, '_update_current_report_label'):
-            app._update_current_report_label()
-
-        app.report_emb = app.embedder.encode(app.report_paras)
-        
-        app.status_label.config(text=translate("report_ready"))
-        app.run_match_btn.config(state=tk.NORMAL)
-        app.export_menu.entryconfig(1, state=tk.NORMAL)
-        # Update active report label again (state ready)
-        if hasattr(app, '_update_current_report_label'):
-            app._update_current_report_label()
-    except Exception as e:
-        messagebox.showerror(translate("error_processing_report"), f"An error occurred:\n{e}")
+    setattr(app, job["path_attr"], path)
+    app.status_label.config(text=job["status"](path))
+    # Prevent starting a second job, or matching half-loaded data, while this one runs
+    buttons = [getattr(app, attr) for attr in app.job_button_attrs]
+    button_states = [str(button.cget("state")) for button in buttons]
+    for button in buttons:
+        button.config(state=tk.DISABLED)
+
+    def restore_buttons():
+        for button, state in zip(buttons, button_states):
+            button.config(state=state)
+
+    def on_done(result):
+        restore_buttons()
+        job["apply"](app, result)  # May enable further buttons
+        if on_finished:
+            on_finished()
+
+    def on_error(e):
+        restore_buttons()
+        messagebox.showerror(translate(job["error_key"]), f"An error occurred:\n{e}")
         app.status_label.config(text=translate("error_try_again"))
+        if on_finished:
+            on_finished()
+
+    _run_bg(app, lambda post_ui: job["process"](app, path, post_ui), on_done, on_error)
+
+def select_standard_file(app, on_finished=None):
+    """
+    Opens a dialog to select a standard PDF, extracts requirements, and updates the app's UI and state.
+    Extraction and embedding run in a background thread; the UI is updated once they are done.
+    Args:
+        app: The main ComplianceApp instance.
+        on_finished (callable, optional): Called on the main thread after processing has finished,
+                                          whether it succeeded or not.
+    """
+    _pick_pdf_and_process(app, "standard", on_finished)
+
+def select_report_file(app):
+    """
+    Opens a dialog to select a report PDF, extracts paragraphs, and updates the app's UI and state.
+    Parsing and embedding run in a background thread; the UI is updated once they are done.
+    Args:
+        app: The main ComplianceApp instance.
+    """
+    _pick_pdf_and_process(app, "report")
 
 def select_reports_multi(app):
     """
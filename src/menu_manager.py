@@ -1,4 +1,5 @@
 import tkinter as tk
+from functools import partial
 from exporter import (
     is_export_available,
     export_requirements,
@@ -7,27 +8,28 @@ from exporter import (
 )
 from translations import translate
 
+# Menu label and export format of each entry in the export submenus
+_EXPORT_FORMATS = (("as CSV...", 'csv'), ("as Excel...", 'excel'), ("as PDF...", 'pdf'))
+
 def configure_export_menu(app, export_menu):
     """
     Configures the export menu with options for exporting requirements, report paragraphs, and matches.
     """
-    # Submenu for exporting requirements
-    req_export_menu = tk.Menu(export_menu, tearoff=0)
-    req_export_menu.add_command(label="as CSV...", command=lambda: export_requirements(app.requirements_data, 'csv'), state=tk.NORMAL if is_export_available('csv') else tk.DISABLED)
-    req_export_menu.add_command(label="as Excel...", command=lambda: export_requirements(app.requirements_data, 'excel'), state=tk.NORMAL if is_export_available('excel') else tk.DISABLED)
-    req_export_menu.add_command(label="as PDF...", command=lambda: export_requirements(app.requirements_data, 'pdf'), state=tk.NORMAL if is_export_available('pdf') else tk.DISABLED)
-    export_menu.add_cascade(label=translate("export_reqs"), menu=req_export_menu, state=tk.DISABLED)
-
-    # Submenu for exporting report paragraphs
-    paras_export_menu = tk.Menu(export_menu, tearoff=0)
-    paras_export_menu.add_command(label="as CSV...", command=lambda: export_report_paras(app.report_paras, 'csv'), state=tk.NORMAL if is_export_available('csv') else tk.DISABLED)
-    paras_export_menu.add_command(label="as Excel...", command=lambda: export_report_paras(app.report_paras, 'excel'), state=tk.NORMAL if is_export_available('excel') else tk.DISABLED)
-    paras_export_menu.add_command(label="as PDF...", command=lambda: export_report_paras(app.report_paras, 'pdf'), state=tk.NORMAL if is_export_available('pdf') else tk.DISABLED)
-    export_menu.add_cascade(label=translate("export_paras"), menu=paras_export_menu, state=tk.DISABLED)
+    # The app's data attributes are rebound whenever a file is loaded, so they are read when an entry is clicked
+    exports = (
+        # Submenu for exporting requirements
+        ("export_reqs", lambda fmt: export_requirements(app.requirements_data, fmt)),
+        # Submenu for exporting report paragraphs
+        ("export_paras", lambda fmt: export_report_paras(app.report_paras, fmt)),
+        # Submenu for exporting matching results
+        ("export_matches", lambda fmt: export_matches(app.matches, app.requirements_data, app.report_paras, fmt)),
+    )
+    # Check each format once instead of once per menu entry
+    states = {fmt: tk.NORMAL if is_export_available(fmt) else tk.DISABLED for _, fmt in _EXPORT_FORMATS}
 
-    # Submenu for exporting matching results
-    matches_export_menu = tk.Menu(export_menu, tearoff=0)
-    matches_export_menu.add_command(label="as CSV...", command=lambda: export_matches(app.matches, app.requirements_data, app.report_paras, 'csv'), state=tk.NORMAL if is_export_available('csv') else tk.DISABLED)
-    matches_export_menu.add_command(label="as Excel...", command=lambda: export_matches(app.matches, app.requirements_data, app.report_paras, 'excel'), state=tk.NORMAL if is_export_available('excel') else tk.DISABLED)
-    matches_export_menu.add_command(label="as PDF...", command=lambda: export_matches(app.matches, app.requirements_data, app.report_paras, 'pdf'), state=tk.NORMAL if is_export_available('pdf') else tk.DISABLED)
-    export_menu.add_cascade(label=translate("export_matches"), menu=matches_export_menu, state=tk.DISABLED)
+    for title_key, export in exports:
+        submenu = tk.Menu(export_menu, tearoff=0)
+        for label, fmt in _EXPORT_FORMATS:
+            # partial binds the format now, avoiding the late binding of a loop variable in a lambda
+            submenu.add_command(label=label, command=partial(export, fmt), state=states[fmt])
+        export_menu.add_cascade(label=translate(title_key), menu=submenu, state=tk.DISABLED)
@@ -8,15 +8,111 @@ Key Features:
 - Extracts paragraphs based on double line breaks or sentence-based segmentation as a fallback.
 - Filters paragraphs based on minimum word/character count and optional noise patterns.
 - Provides debug mode for detailed statistics during text extraction.
+- Caches the extracted page texts on disk, so re-parsing an unchanged PDF (e.g., with other
+  filter parameters or in a later session) skips the PDF decoding.
 
 Usage:
 - Use `extract_paragraphs_from_pdf(pdf_path, ...)` to extract cleaned paragraphs from a PDF file.
 - Customize parameters like `min_words`, `min_chars`, and `noise_filter` to suit specific requirements.
 """
 
+import functools
+import hashlib
+import os
+import pickle
 import pdfplumber
 import re
 
+# Bump when paragraph extraction changes, so cached report embeddings are invalidated
+PARSER_VERSION = 1
+_PAGES_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "sustainability-nlp", "pages")
+
+# Regex patterns for filtering out noise (e.g., metadata, headers, URLs).
+# Each entry is a single alternative (no top-level "|"), see `_NOISE_REGEX`.
+_NOISE_PATTERNS = (
+    # Table of contents and chapter headings
+    r"^(Table of Contents|List of Figures|List of Tables|Appendix|Inhaltsverzeichnis|Abbildungsverzeichnis|Tabellenverzeichnis|Anhang)$",
+    r"^Page\s*\d+",
+    r"^Seite\s*\d+",
+    # Management texts and salutations
+    r"^Dear (Shareholders|Readers|Stakeholders|Customers)",
+    r"^(Sehr geehrte|Liebe) (Damen und Herren|Aktionär.*|Leser.*)",
+    # URLs and email addresses
+    r"\bhttps?://\S+",
+    r"\S+@\S+\.\S+",
+    # Standard references (multilingual)
+    r"\bGRI\s*\d{1,3}(-\d{1,3})?",  # GRI 1–999
+    r"\bGlobal Reporting Initiative\b",
+    r"\bGRI[- ]?(Standards|SRS|Index|Bericht)?\b",
+    r"\bDNK\b",
+    r"\bDeutscher Nachhaltigkeitskodex\b",
+    r"\bCSRD\b",
+    r"\bCorporate Sustainability Reporting Directive\b",
+    r"\bESRS\s*[A-Z]?\d{0,3}(-\d+)?",
+    r"\bEFRAG\b",
+    r"\bUN\b.*?(Compact|Principles|SDG|Agenda)",
+    r"\bUnited Nations\b.*?(Treaty|Guideline|Charter)?",
+    r"\bOECD\b.*?(Guidelines|Principles)?",
+    r"\bIFRS\s*\d{0,3}",
+    r"\bISO\s*\d{4,6}",
+    r"\bEU[- ]?(Directive|Regulation|Verordnung|Richtlinie)?\s*\d{4}\/\d{1,5}",
+    r"\b(Artikel|Art\.?)\s*\d+(\s*[a-z]*)?\s*(Abs\.?|Paragraph)?\s*\d*",
+    r"\bCSR[- ]?(Richtlinie|Directive|RUG|Umsetzungsgesetz)\b",
+    # Topic and disclosure labels
+    r"\bAngabe\s*\d{3}-\d{1,3}",
+    r"\bDisclosure\s+(Requirement|DR)\s+[A-Z]?\d{1,2}(-\d{1,2})?",
+    r"\bKriterium\s*\d+",
+    r"\bIndikator\s*\d+",
+    r"\bKey (figures|metrics|indicators)\b",
+    r"\bThemenstandard\b",
+    r"\bTopic standard\b",
+    # Glossary, appendix, bibliography, footnotes
+    r"^(Glossary|Annex|Attachment|Appendix|Bibliography|Footnote|Quellen|Anhang|Glossar|Literaturverzeichnis)\b",
+    r"\[\d+\]",  # e.g., [1], [24]
+    # Legal notices and copyrights
+    r"\b(All rights reserved|Haftungsausschluss|Rechtsgrundlage|Impressum|Datenschutz|Copyright|Markenzeichen|Disclaimer)\b",
+    # Metadata and mandatory information
+    r"\bReporting period\b",
+    r"\bBerichtszeitraum\b",
+    r"\bBerichtspflicht(ig)?\b",
+    r"\bComply or Explain\b",
+    r"\b(Stand|Version):?\s*\d{4}",
+)
+# All patterns fused into one regex, compiled once at import, so each paragraph is scanned once.
+# Alternatives starting at a word boundary share a single leading \b: positions inside a word
+# are then rejected with one check instead of one per pattern (~3x faster than separate searches).
+_NOISE_REGEX = re.compile(
+    r"\b(?:" + "|".join(f"(?:{p[2:]})" for p in _NOISE_PATTERNS if p.startswith(r"\b")) + ")|"
+    + "|".join(f"(?:{p})" for p in _NOISE_PATTERNS if not p.startswith(r"\b")),
+    re.IGNORECASE,
+)
+# A blank-line run between two non-whitespace characters other than hyphens (a "-\n" next to it is
+# smoothed away). No cleaning step reaches across it, so text can be split there while streaming pages.
+_SAFE_BREAK_RE = re.compile(r"(?<=[^\s-])\n{2,}(?=[^\s-])")
+
+# Whitespace runs, and sentence breaks (punctuation followed by a capital letter) for the fallback segmentation
+_WHITESPACE_RE = re.compile(r"\s+")
+_SENTENCE_BREAK_RE = re.compile(r"(?<=[\.!?])\s+(?=[A-ZÄÖÜ])")
+
+
+def _iter_sentences(text):
+    """
+    Yields the sentences of a text, as `_SENTENCE_BREAK_RE.split(text)` would return them,
+    without building the list of all sentences.
+
+    Args:
+        text (str): The text to split, with whitespace already collapsed.
+
+    Yields:
+        str: The sentences in order.
+    """
+    start = 0
+    for m in _SENTENCE_BREAK_RE.finditer(text):
+        yield text[start:m.start()]
+        start = m.end()
+    yield text[start:]
+
+
 def clean_text(text):
     """
     Cleans the input text by removing unnecessary line breaks and spaces.
@@ -33,6 +129,80 @@ def clean_text(text):
     return text.strip()
 
 
+def _pages_cache_path(pdf_path):
+    """
+    Builds the cache file path for the page texts of a PDF.
+    The key covers the file path, modification time and size, so any change to the file results in a cache miss.
+
+    Args:
+        pdf_path (str): Path to the PDF file.
+
+    Returns:
+        str: Path of the pickle file holding the cached page texts.
+    """
+    st = os.stat(pdf_path)
+    raw_key = f"{os.path.abspath(pdf_path)}:{st.st_mtime_ns}:{st.st_size}"
+    key = hashlib.blake2b(raw_key.encode("utf-8")).hexdigest()
+    return os.path.join(_PAGES_CACHE_DIR, f"{key}.pkl")
+
+
+def _load_cached_pages(cache_path):
+    """
+    Loads cached page texts, returning None if the entry is missing or unreadable.
+    """
+    try:
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Ignoring unreadable cache entry {cache_path}: {e}")
+        return None
+
+
+def _store_cached_pages(cache_path, pages):
+    """
+    Stores page texts in the cache. Failures are reported but never fatal.
+    """
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(pages, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)  # Atomic, so readers never see a partial file
+    except OSError as e:
+        print(f"Could not write cache entry {cache_path}: {e}")
+
+
+def _iter_pdf_pages(pdf_path):
+    """
+    Yields the text of each page of a PDF, in page order.
+    """
+    with pdfplumber.open(pdf_path) as pdf:
+        for page in pdf.pages:
+            yield page.extract_text() or ""
+
+
+def count_uncached_pages(pdf_path):
+    """
+    Counts the pages of a PDF whose text still has to be extracted, i.e. 0 if its page texts are cached.
+    Unreadable files count as 0; the error is reported when the file is parsed.
+
+    Args:
+        pdf_path (str): Path to the PDF file.
+
+    Returns:
+        int: The number of pages to decode.
+    """
+    try:
+        if os.path.exists(_pages_cache_path(pdf_path)):
+            return 0
+        with pdfplumber.open(pdf_path) as pdf:
+            return len(pdf.pages)
+    except Exception:
+        return 0
+
+
 def extract_paragraphs_from_pdf(
     pdf_path, min_words=20, min_chars=100, noise_filter=True, debug=False
 ):
@@ -42,6 +212,7 @@ def extract_paragraphs_from_pdf(
     Filters out paragraphs with fewer than `min_words` words or `min_chars` characters.
     Optionally removes typical metadata patterns using `noise_filter`.
     Outputs debug statistics if `debug=True`.
+    Results are memoized in-process per file path, modification time and size.
 
     Args:
         pdf_path (str): Path to the PDF file.
@@ -53,108 +224,109 @@ def extract_paragraphs_from_pdf(
     Returns:
         list of str: A list of cleaned and filtered paragraphs extracted from the PDF.
     """
-    # Define regex patterns for filtering out noise (e.g., metadata, headers, URLs)
-    noise_patterns = [
-        # Table of contents and chapter headings
-        r"^(Table of Contents|List of Figures|List of Tables|Appendix|Inhaltsverzeichnis|Abbildungsverzeichnis|Tabellenverzeichnis|Anhang)$",
-        r"^Page\s*\d+|^Seite\s*\d+",
-        # Management texts and salutations
-        r"^Dear (Shareholders|Readers|Stakeholders|Customers)",
-        r"^(Sehr geehrte|Liebe) (Damen und Herren|Aktionär.*|Leser.*)",
-        # URLs and email addresses
-        r"\bhttps?://\S+",
-        r"\S+@\S+\.\S+",
-        # Standard references (multilingual)
-        r"\bGRI\s*\d{1,3}(-\d{1,3})?",  # GRI 1–999
-        r"\bGlobal Reporting Initiative\b",
-        r"\bGRI[- ]?(Standards|SRS|Index|Bericht)?\b",
-        r"\bDNK\b|\bDeutscher Nachhaltigkeitskodex\b",
-        r"\bCSRD\b|\bCorporate Sustainability Reporting Directive\b",
-        r"\bESRS\s*[A-Z]?\d{0,3}(-\d+)?",
-        r"\bEFRAG\b",
-        r"\bUN\b.*?(Compact|Principles|SDG|Agenda)",
-        r"\bUnited Nations\b.*?(Treaty|Guideline|Charter)?",
-        r"\bOECD\b.*?(Guidelines|Principles)?",
-        r"\bIFRS\s*\d{0,3}",
-        r"\bISO\s*\d{4,6}",
-        r"\bEU[- ]?(Directive|Regulation|Verordnung|Richtlinie)?\s*\d{4}\/\d{1,5}",
-        r"\b(Artikel|Art\.?)\s*\d+(\s*[a-z]*)?\s*(Abs\.?|Paragraph)?\s*\d*",
-        r"\bCSR[- ]?(Richtlinie|Directive|RUG|Umsetzungsgesetz)\b",
-        # Topic and disclosure labels
-        r"\bAngabe\s*\d{3}-\d{1,3}",
-        r"\bDisclosure\s+(Requirement|DR)\s+[A-Z]?\d{1,2}(-\d{1,2})?",
-        r"\bKriterium\s*\d+",
-        r"\bIndikator\s*\d+",
-        r"\bKey (figures|metrics|indicators)\b",
-        r"\bThemenstandard\b|\bTopic standard\b",
-        # Glossary, appendix, bibliography, footnotes
-        r"^(Glossary|Annex|Attachment|Appendix|Bibliography|Footnote|Quellen|Anhang|Glossar|Literaturverzeichnis)\b",
-        r"\[\d+\]",  # e.g., [1], [24]
-        # Legal notices and copyrights
-        r"\b(All rights reserved|Haftungsausschluss|Rechtsgrundlage|Impressum|Datenschutz|Copyright|Markenzeichen|Disclaimer)\b",
-        # Metadata and mandatory information
-        r"\bReporting period\b|\bBerichtszeitraum\b",
-        r"\bBerichtspflicht(ig)?\b",
-        r"\bComply or Explain\b",
-        r"\b(Stand|Version):?\s*\d{4}",
-    ]
-    # Compile noise regex patterns
-    noise_regex = [re.compile(p, re.IGNORECASE) for p in noise_patterns]
-
-    # Read the PDF and combine text from all pages
-    with pdfplumber.open(pdf_path) as pdf:
-        pages = [page.extract_text() or "" for page in pdf.pages]
-    raw_text = "\n".join(pages)
+    if debug:
+        # Debug statistics are printed during extraction, so bypass the cache
+        return _extract_paragraphs(pdf_path, min_words, min_chars, noise_filter, debug)
 
-    # Optionally clean the raw text
-    try:
-        raw_text = clean_text(raw_text)
-    except NameError:
-        raw_text = raw_text
+    # Results are memoized per file version; return a copy so callers may modify their list
+    st = os.stat(pdf_path)
+    return list(_extract_paragraphs_cached(
+        os.path.abspath(pdf_path), st.st_mtime_ns, st.st_size, min_words, min_chars, noise_filter
+    ))
 
-    # Smooth line breaks
-    text = re.sub(r"-\n", "", raw_text)
-    text = text.replace("\r\n", "\n")
 
-    # Primary paragraph segmentation: split by double line breaks
-    raw_paragraphs = re.split(r"\n{2,}", text)
+@functools.lru_cache(maxsize=8)
+def _extract_paragraphs_cached(pdf_path, mtime_ns, size, min_words, min_chars, noise_filter):
+    """
+    Memoized `_extract_paragraphs`. `mtime_ns` and `size` are only part of the cache key,
+    so a modified file is parsed again.
+    """
+    return _extract_paragraphs(pdf_path, min_words, min_chars, noise_filter, debug=False)
 
-    paragraphs = []
+
+def _extract_paragraphs(pdf_path, min_words, min_chars, noise_filter, debug):
+    """
+    Implementation of `extract_paragraphs_from_pdf`; see there for the arguments.
+    """
+
+    # Function to clean, smooth and split a piece of text into raw paragraphs
+    def segment(chunk):
+        text = clean_text(chunk)
+        # Smooth line breaks
+        text = re.sub(r"-\n", "", text)
+        text = text.replace("\r\n", "\n")
+        # Primary paragraph segmentation: split by double line breaks
+        return re.split(r"\n{2,}", text)
 
     # Function to check if a paragraph matches noise patterns
     def is_noise(p):
-        return any(rx.search(p) for rx in noise_regex)
+        return _NOISE_REGEX.search(p) is not None
 
     # Function to filter paragraphs by length and noise
     def filter_paras(candidates):
         filtered = []
         for p in candidates:
             p = p.strip()
-            if len(p.split()) < min_words or len(p) < min_chars:
+            # Cheap length check first; only paragraphs passing it are split into words
+            if len(p) < min_chars or len(p.split()) < min_words:
                 continue
             if noise_filter and is_noise(p):
                 continue
             filtered.append(p)
         return filtered
 
-    paragraphs = filter_paras(raw_paragraphs)
+    # Read the PDF page by page and segment the text as it streams in, instead of joining all pages
+    # and rewriting the whole document with each regex. Text after the last safe paragraph break is
+    # kept pending until a later page, so paragraphs spanning a page break are kept intact.
+    # Page texts come from the disk cache if this file version was read before
+    cache_path = _pages_cache_path(pdf_path)
+    cached_pages = _load_cached_pages(cache_path)
+
+    pages = []
+    paragraphs = []
+    pending = []  # Raw text since the last safe break
+    tail = ""  # End of the pending text from its last non-whitespace character, where a break may start
+    for page_text in cached_pages if cached_pages is not None else _iter_pdf_pages(pdf_path):
+        piece = f"\n{page_text}" if pages else page_text
+        pages.append(page_text)
+
+        window = tail + piece
+        last_break = None
+        for last_break in _SAFE_BREAK_RE.finditer(window):
+            pass
+        if last_break:
+            chunk = "".join(pending) + piece
+            cut = len(chunk) - len(window) + last_break.start()
+            paragraphs.extend(filter_paras(segment(chunk[:cut])))
+            piece = window[last_break.end():]
+            pending, tail = [], ""
+
+        pending.append(piece)
+        stripped = piece.rstrip()
+        tail = piece[len(stripped) - 1:] if stripped else tail + piece
+    paragraphs.extend(filter_paras(segment("".join(pending))))
+
+    if cached_pages is None:
+        _store_cached_pages(cache_path, pages)
+
     # Fallback: sentence-based segmentation if too few paragraphs are found
     if len(paragraphs) < 2:
         if debug:
             print(
                 "Too few paragraphs after primary segmentation, attempting sentence-based segmentation."
             )
-        # Sentence splitting: split by punctuation followed by a capital letter
-        sentences = re.split(
-            r"(?<=[\.!?])\s+(?=[A-ZÄÖÜ])", re.sub(r"\s+", " ", raw_text)
-        )
-        if debug:
-            print(f"Found sentences: {len(sentences)}")
+        # The sentence fallback needs the whole document, which is only joined here
+        raw_text = clean_text("\n".join(pages))
+        # Sentence splitting: split by punctuation followed by a capital letter.
+        # Sentences are streamed into the accumulator below instead of being collected in a list first.
+        sentences = _iter_sentences(_WHITESPACE_RE.sub(" ", raw_text))
 
         # Combine sentences into potential paragraphs
         all_paragraphs_from_sentences = []
         current = ""
+        sentence_count = 0
         for sent in sentences:
+            sentence_count += 1
             if not current:
                 current = sent.strip()
             else:
@@ -165,6 +337,8 @@ def extract_paragraphs_from_pdf(
                 current = ""
         if current:  # Add any remaining text
             all_paragraphs_from_sentences.append(current)
+        if debug:
+            print(f"Found sentences: {sentence_count}")
 
         # Replace raw paragraphs with those generated from sentences
         raw_paragraphs = all_paragraphs_from_sentences
@@ -0,0 +1,51 @@
+"""
+This script provides the process pool used to parse PDFs in parallel worker processes
+(blocks of pages of a standard in `extractor.py`, whole reports in `MultiReportUI.py`).
+
+Key Features:
+- Always uses the 'spawn' start method. The pool is started from the background thread of a process
+  that has loaded torch, and forking a multi-threaded process can deadlock the child.
+- Spawned workers re-import the launching script (`UI.py` or `MultiReportUI.py`) and with it torch and
+  sentence-transformers, so the pool is only used when there are enough pages to decode for that
+  start-up cost to pay off, and more than one CPU core to run the workers on.
+
+Usage:
+- Check `worth_parallelizing(page_count)` before parsing in parallel.
+- Create the executor with `make_process_pool(max_workers)`.
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# Minimum number of PDF pages to decode before a process pool pays off. Measured with a launching
+# script that imports torch: a spawned worker needs ~1.6 s to start (more once sentence-transformers
+# is imported too), while pdfplumber extracts ~0.1-0.3 s per page. On 2 cores the pool breaks even
+# at ~12-32 pages; the threshold leaves a margin for the slower imports and lighter pages.
+PARALLEL_MIN_PAGES = 64
+
+
+def worth_parallelizing(page_count):
+    """
+    Decides whether decoding `page_count` PDF pages in a process pool is faster than doing it serially.
+
+    Args:
+        page_count (int): The number of pages that have to be decoded.
+
+    Returns:
+        bool: True if there are several CPU cores and at least `PARALLEL_MIN_PAGES` pages.
+    """
+    return (os.cpu_count() or 1) > 1 and page_count >= PARALLEL_MIN_PAGES
+
+
+def make_process_pool(max_workers):
+    """
+    Creates a process pool whose workers are started with the 'spawn' method.
+
+    Args:
+        max_workers (int): The maximum number of worker processes.
+
+    Returns:
+        concurrent.futures.ProcessPoolExecutor: The executor; use it as a context manager.
+    """
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
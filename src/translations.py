@@ -10,6 +10,7 @@ Key Features:
 
 Usage:
 - Use `translate(key, **kwargs)` to retrieve the translated text for a given key.
+- Use `translate_batch(keys)` to retrieve the texts for several keys without placeholders at once.
 - Call `switch_language()` to toggle the current language between English and German.
 """
 
@@ -201,8 +202,13 @@ TRANSLATIONS = {
     },
 }
 
+# Languages in switching order; a table added to TRANSLATIONS joins the cycle
+_LANGS = tuple(TRANSLATIONS)
+
 # Default language
 current_language = "de"
+# Table of the current language, rebound only by `switch_language`, so `translate` needs a single lookup
+_ACTIVE = TRANSLATIONS[current_language]
 
 
 def translate(key, **kwargs):
@@ -217,13 +223,31 @@ def translate(key, **kwargs):
     Returns:
         str: The translated and formatted text.
     """
-    text = TRANSLATIONS.get(current_language, {}).get(key, key)
-    return text.format(**kwargs)
+    text = _ACTIVE.get(key, key)
+    # Only parse the string for placeholders when values were given; format_map uses kwargs as is
+    return text.format_map(kwargs) if kwargs else text
+
+
+def translate_batch(keys):
+    """
+    Returns the translated texts for several keys at once, looking up the active language table once.
+    Keys without a translation are returned unchanged, as in `translate`.
+
+    Args:
+        keys (iterable of str): The keys of the texts to be translated.
+
+    Returns:
+        tuple of str: The translated texts, in the order of `keys`.
+    """
+    active = _ACTIVE
+    return tuple(active.get(key, key) for key in keys)
 
 
 def switch_language():
     """
     Toggles the current language between English ('en') and German ('de').
+    Cycles through all languages in TRANSLATIONS if more are added.
     """
-    global current_language
-    current_language = "de" if current_language == "en" else "en"
+    global current_language, _ACTIVE
+    current_language = _LANGS[(_LANGS.index(current_language) + 1) % len(_LANGS)]
+    _ACTIVE = TRANSLATIONS[current_language]